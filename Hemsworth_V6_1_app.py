@@ -1,15 +1,12 @@
 # 🦸 Hemsworth V6.2 Training System — Full Control + Working Day & Block Builder
 
+import hashlib
 import streamlit as st
 import pandas as pd
+import numpy as np
 from pathlib import Path
 from datetime import datetime
-import plotly.express as px
 from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib import colors
 
 # -------------------------------------------------
 # Setup
@@ -21,7 +18,8 @@ st.caption("Full Control Edition — Working Day/Block Builder + Safe Data Types
 DATA_PATH = Path("data") / "Hemsworth_Lift_Library.xlsx"
 LOG_PATH = Path("data") / "user_logs.csv"
 BLOCK_PATH = Path("data") / "custom_blocks.csv"
-CUSTOM_DAY_PATH = Path("data") / "Hemsworth_Custom_Days.csv"
+CUSTOM_DAY_PATH = Path("data") / "Hemsworth_Custom_Days.csv"   # legacy single-file layout
+CUSTOM_DAY_DIR = Path("data") / "custom_days"
 UNDO_PATH = Path("data") / "undo_last_save.csv"
 
 # -------------------------------------------------
@@ -31,36 +29,111 @@ def ensure_dirs():
     DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
 ensure_dirs()
 
+LIBRARY_COLS = [
+    "DayTag","Lift / Exercise","Purpose / Role","Region / Muscle Focus",
+    "Standard Sets×Reps","Hemsworth Sets×Reps","Rest"
+]
+
+def _arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Use Arrow-backed strings for text columns — near-raw-bytes memory vs ~50B/cell
+    object overhead, and .str ops dispatch to Arrow kernels. No-op where the reader
+    already produced string dtype (pandas >= 3)."""
+    obj_cols = [c for c in df.columns if df[c].dtype == object]
+    if obj_cols:
+        df = df.astype({c: "string[pyarrow]" for c in obj_cols})
+    return df
+
+@st.cache_data(show_spinner=False)
+def _read_library(path_str: str, mtime: float) -> pd.DataFrame:
+    """Read the lift library from a Parquet sidecar (converted once per xlsx version)."""
+    path = Path(path_str)
+    pq_path = path.with_suffix(".parquet")
+    if not pq_path.exists() or pq_path.stat().st_mtime < mtime:
+        df = pd.read_excel(path, dtype=str)
+        df.columns = [str(c).strip() for c in df.columns]
+        # Normalize column names
+        for c in list(df.columns):
+            if "rest" in c.lower() and c != "Rest":
+                df.rename(columns={c: "Rest"}, inplace=True)
+        if "Rest" in df.columns:
+            df["Rest"] = df["Rest"].astype(str)
+        for c in LIBRARY_COLS:
+            if c not in df.columns:
+                df[c] = ""
+        df[LIBRARY_COLS].to_parquet(pq_path, index=False)
+    # Column projection — only the columns the app uses get materialized
+    return _arrow_strings(pd.read_parquet(pq_path, columns=LIBRARY_COLS))
+
 def load_library(path: Path):
-    """Load Excel safely and fix column names."""
+    """Load Excel safely and fix column names (cached per file version)."""
     if not path.exists():
         st.error(f"❌ File not found: {path}")
         return None
-    df = pd.read_excel(path, dtype=str)
-    df.columns = [str(c).strip() for c in df.columns]
-    # Normalize column names
-    for c in list(df.columns):
-        if "rest" in c.lower() and c != "Rest":
-            df.rename(columns={c: "Rest"}, inplace=True)
-    if "Rest" in df.columns:
-        df["Rest"] = df["Rest"].astype(str)
+    return _read_library(str(path), path.stat().st_mtime)
+
+CACHE_DIR = Path(".cache")
+
+def _disk_cache_path(path_str: str, mtime_ns: int) -> Path:
+    """Parquet cache file for a source file version; survives worker restarts.
+
+    Full-resolution mtime in the name — whole seconds would collide when
+    two appends land within the same second and serve a stale cache file.
+    """
+    stem = hashlib.md5(path_str.encode()).hexdigest()
+    return CACHE_DIR / f"{stem}-{mtime_ns}.parquet"
+
+@st.cache_data(show_spinner=False)
+def _read_csv_cached(path_str: str, mtime_ns: int, cols: tuple) -> pd.DataFrame:
+    cache_file = _disk_cache_path(path_str, mtime_ns)
+    if cache_file.exists():
+        return _arrow_strings(pd.read_parquet(cache_file))
+    df = pd.read_csv(path_str, dtype=str, keep_default_na=False)
+    for c in cols:
+        if c not in df.columns:
+            df[c] = ""
+    df = _arrow_strings(df[list(cols)])
+    CACHE_DIR.mkdir(exist_ok=True)
+    for stale in CACHE_DIR.glob(f"{cache_file.name.split('-')[0]}-*.parquet"):
+        stale.unlink(missing_ok=True)
+    df.to_parquet(cache_file, index=False)
     return df
 
 def load_csv(path: Path, cols: list[str]):
-    """Load CSV safely."""
+    """Load CSV safely (cached per file version)."""
     if path.exists():
-        df = pd.read_csv(path, dtype=str, keep_default_na=False)
-        for c in cols:
-            if c not in df.columns:
-                df[c] = ""
-        df = df[cols]
-    else:
-        df = pd.DataFrame(columns=cols)
-    return df
+        return _read_csv_cached(str(path), path.stat().st_mtime_ns, tuple(cols))
+    return pd.DataFrame(columns=cols)
+
+LOG_COLS = ["Date","DayTag","Lift / Exercise","Weight (lbs)","Reps","Notes","Mode"]
+
+@st.cache_data(show_spinner=False)
+def load_typed_logs(path_str: str, mtime: float) -> pd.DataFrame:
+    """Typed log frame for the dashboard — dates parsed and Volume/Week computed once."""
+    log = load_csv(Path(path_str), LOG_COLS)
+    log["Date"] = pd.to_datetime(log["Date"], errors="coerce")
+    # Narrow dtypes: uint16 covers the widget ranges, and category makes the
+    # dashboard groupbys hash integer codes instead of Python strings.
+    log["Weight (lbs)"] = pd.to_numeric(log["Weight (lbs)"], errors="coerce").fillna(0).astype("uint16")
+    log["Reps"] = pd.to_numeric(log["Reps"], errors="coerce").fillna(0).astype("uint16")
+    log["DayTag"] = log["DayTag"].astype("category")
+    log["Lift / Exercise"] = log["Lift / Exercise"].astype("category")
+    # Widen before multiplying so Volume can't wrap in uint16
+    log["Volume"] = log["Weight (lbs)"].astype("int32") * log["Reps"].astype("int32")
+    log["Week"] = log["Date"].dt.isocalendar().week
+    return log
+
+def _mtime(path: Path) -> float:
+    return path.stat().st_mtime if path.exists() else 0.0
 
 def save_csv(df: pd.DataFrame, path: Path):
     df.to_csv(path, index=False)
 
+def save_csv_append(row_df: pd.DataFrame, path: Path):
+    """Append rows to an append-only CSV (logs/blocks); header only for a new/empty file."""
+    write_header = not path.exists() or path.stat().st_size == 0
+    with path.open("a", newline="") as f:
+        row_df.to_csv(f, index=False, header=write_header)
+
 def plan_columns():
     return [
         "DayTag","Order","Lift / Exercise","Purpose / Role",
@@ -69,30 +142,85 @@ def plan_columns():
     ]
 
 def _plan_type_safety(plan: pd.DataFrame) -> pd.DataFrame:
-    """Ensure consistent column types."""
+    """Ensure consistent column types; return as-is when already correct."""
+    has_order = "Order" in plan.columns
+    text_cols = [c for c in plan.columns if c != "Order"]
+    if (all(pd.api.types.is_string_dtype(plan[c]) for c in text_cols)
+            and (not has_order or plan["Order"].dtype.kind == "i")):
+        # Common path: loaders already produce string columns and an int Order,
+        # so skip the full-frame copy + cast
+        return plan
     plan = plan.copy()
-    for c in plan.columns:
+    for c in text_cols:
         plan[c] = plan[c].astype(str)
-    if "Order" in plan.columns:
+    if has_order:
         plan["Order"] = pd.to_numeric(plan["Order"], errors="coerce").fillna(1).astype(int)
     return plan
 
+@st.cache_data(show_spinner=False)
+def _build_master_index(_df: pd.DataFrame, lib_mtime: float) -> dict:
+    """Lift name -> metadata dict, built once per library version."""
+    meta_cols = ["Purpose / Role","Region / Muscle Focus",
+                 "Standard Sets×Reps","Hemsworth Sets×Reps","Rest"]
+    return (_df.drop_duplicates("Lift / Exercise")
+               .set_index("Lift / Exercise")[meta_cols]
+               .to_dict("index"))
+
 def get_master_row(df_master, lift_name):
-    row = df_master[df_master["Lift / Exercise"] == lift_name]
-    if row.empty:
-        return {}
-    r = row.iloc[0]
-    return {
-        "Purpose / Role": r.get("Purpose / Role", ""),
-        "Region / Muscle Focus": r.get("Region / Muscle Focus", ""),
-        "Standard Sets×Reps": r.get("Standard Sets×Reps", ""),
-        "Hemsworth Sets×Reps": r.get("Hemsworth Sets×Reps", ""),
-        "Rest": r.get("Rest", "")
-    }
+    index = _build_master_index(df_master, DATA_PATH.stat().st_mtime if DATA_PATH.exists() else 0.0)
+    return index.get(lift_name, {})
+
+def _day_shard(day: str) -> Path:
+    return CUSTOM_DAY_DIR / f"{day.replace(' ', '_').lower()}.csv"
+
+def _custom_days_version() -> tuple:
+    """Shard names + mtimes (cache key for plan builds).
+
+    A tuple of (name, mtime) pairs rather than max(mtime): deleting a
+    shard must change the key too, or a reset would serve the cached
+    snapshot that still contains the deleted layout.
+    """
+    stamps = [(CUSTOM_DAY_PATH.name, CUSTOM_DAY_PATH.stat().st_mtime_ns)] if CUSTOM_DAY_PATH.exists() else []
+    if CUSTOM_DAY_DIR.exists():
+        stamps += [(p.name, p.stat().st_mtime_ns) for p in sorted(CUSTOM_DAY_DIR.glob("*.csv"))]
+    return tuple(stamps)
+
+@st.cache_data(show_spinner=False)
+def _load_custom_days_cached(version: tuple) -> pd.DataFrame:
+    frames = []
+    if CUSTOM_DAY_DIR.exists():
+        frames = [pd.read_csv(p, dtype=str, keep_default_na=False)
+                  for p in sorted(CUSTOM_DAY_DIR.glob("*.csv"))]
+    if not frames:
+        return pd.DataFrame(columns=plan_columns())
+    df = pd.concat(frames, ignore_index=True)
+    for c in plan_columns():
+        if c not in df.columns:
+            df[c] = ""
+    return _arrow_strings(df[plan_columns()])
+
+def load_custom_days() -> pd.DataFrame:
+    return _load_custom_days_cached(_custom_days_version())
+
+def save_custom_day(day: str, day_df: pd.DataFrame):
+    """Persist only the edited day's shard — O(one day) instead of O(all days)."""
+    CUSTOM_DAY_DIR.mkdir(parents=True, exist_ok=True)
+    shard = _day_shard(day)
+    if day_df.empty:
+        shard.unlink(missing_ok=True)
+    else:
+        day_df.to_csv(shard, index=False)
 
 def normalize_order(df: pd.DataFrame):
-    df = df.sort_values("Order").reset_index(drop=True)
-    df["Order"] = range(1, len(df)+1)
+    order = df["Order"]
+    # Already exactly 1..n — nothing to do. Uniqueness matters: the grid
+    # editor lets duplicate Orders through, and non-strict monotonicity
+    # would wave them past the renumber.
+    if (len(df) and order.is_unique and order.is_monotonic_increasing
+            and order.iloc[0] == 1 and order.iloc[-1] == len(df)):
+        return df
+    df = df.sort_values("Order", kind="stable", ignore_index=True)
+    df["Order"] = np.arange(1, len(df) + 1, dtype=np.int32)
     return df
 
 # -------------------------------------------------
@@ -106,111 +234,138 @@ if df is None:
 st.write("📘 Excel Loaded:", len(df), "rows")
 st.dataframe(df.head(), use_container_width=True)
 
-user_log = load_csv(LOG_PATH, ["Date","DayTag","Lift / Exercise","Weight (lbs)","Reps","Notes","Mode"])
+@st.cache_data(show_spinner=False)
+def _master_lifts(_df: pd.DataFrame, lib_mtime: float) -> tuple:
+    return tuple(sorted(_df["Lift / Exercise"].dropna().unique()))
+
+# Computed once per library version — the editor and block builder reuse it
+MASTER_LIFTS = _master_lifts(df, _mtime(DATA_PATH))
+
+user_log = load_csv(LOG_PATH, LOG_COLS)
 custom_blocks = load_csv(BLOCK_PATH, ["Lift / Exercise","BlockGroup","DayTag","Purpose / Role"])
-custom_days = load_csv(CUSTOM_DAY_PATH, plan_columns())
+# One-time migration: split the legacy single-file layout into per-day shards
+if CUSTOM_DAY_PATH.exists() and not CUSTOM_DAY_DIR.exists():
+    _legacy = pd.read_csv(CUSTOM_DAY_PATH, dtype=str, keep_default_na=False)
+    CUSTOM_DAY_DIR.mkdir(parents=True, exist_ok=True)
+    if "DayTag" in _legacy.columns:
+        for _tag, _g in _legacy.groupby("DayTag"):
+            _g.to_csv(_day_shard(str(_tag)), index=False)
+    CUSTOM_DAY_PATH.unlink()
+
+custom_days = load_custom_days()
 
 # -------------------------------------------------
 # Fixed get_day_plan()
 # -------------------------------------------------
-def get_day_plan(day: str, df_master: pd.DataFrame, df_custom: pd.DataFrame):
-    """Build plan from Excel or custom override."""
-    df_master.columns = [str(c).strip() for c in df_master.columns]
-    if "DayTag" not in df_master.columns:
-        st.error("⚠️ 'DayTag' column missing in your Excel.")
-        return pd.DataFrame(columns=plan_columns())
-
-    df_master["DayTag"] = df_master["DayTag"].astype(str).str.strip()
-    base = df_master[df_master["DayTag"].str.lower() == day.lower()].copy()
+@st.cache_data(show_spinner=False)
+def _build_day_index(_df: pd.DataFrame, lib_mtime: float) -> dict:
+    """Group library rows by lowercased DayTag once; day tabs then do O(1) lookups."""
+    keyed = _df.assign(_k=_df["DayTag"].astype(str).str.strip().str.lower())
+    return {k: g.drop(columns="_k").reset_index(drop=True) for k, g in keyed.groupby("_k")}
 
+@st.cache_data(show_spinner=False)
+def _build_day_plan(day: str, _df_master: pd.DataFrame, _df_custom: pd.DataFrame,
+                    lib_mtime: float, custom_version: tuple) -> pd.DataFrame:
+    """Build the effective day plan, cached per (day, library version, custom version)."""
     # Check for user override
-    custom = df_custom[df_custom["DayTag"] == day]
+    custom = _df_custom[_df_custom["DayTag"] == day]
     if not custom.empty:
         return _plan_type_safety(custom.sort_values("Order").reset_index(drop=True))
 
-    plan = pd.DataFrame(columns=plan_columns())
-    if base.empty:
-        return _plan_type_safety(plan)
-
-    for order, (_, r) in enumerate(base.iterrows(), start=1):
-        plan.loc[len(plan)] = {
-            "DayTag": day,
-            "Order": order,
-            "Lift / Exercise": r.get("Lift / Exercise", ""),
-            "Purpose / Role": r.get("Purpose / Role", ""),
-            "Region / Muscle Focus": r.get("Region / Muscle Focus", ""),
-            "Standard Sets×Reps": r.get("Standard Sets×Reps", ""),
-            "Hemsworth Sets×Reps": r.get("Hemsworth Sets×Reps", ""),
-            "Rest": str(r.get("Rest", ""))
-        }
+    day_index = _build_day_index(_df_master, lib_mtime)
+    base = day_index.get(day.strip().lower())
+    if base is None or base.empty:
+        return _plan_type_safety(pd.DataFrame(columns=plan_columns()))
+
+    # Vectorized build — column select + insert instead of per-row appends
+    plan = base[["Lift / Exercise","Purpose / Role","Region / Muscle Focus",
+                 "Standard Sets×Reps","Hemsworth Sets×Reps","Rest"]].reset_index(drop=True)
+    plan.insert(0, "DayTag", day)
+    plan.insert(1, "Order", np.arange(1, len(plan) + 1))
     return _plan_type_safety(plan)
 
+def get_day_plan(day: str, df_master: pd.DataFrame, df_custom: pd.DataFrame):
+    """Build plan from Excel or custom override.
+
+    Column names are already normalized by the library loader, so no
+    re-stripping (and no mutation of the shared frame) happens here.
+    """
+    if "DayTag" not in df_master.columns:
+        st.error("⚠️ 'DayTag' column missing in your Excel.")
+        return pd.DataFrame(columns=plan_columns())
+    return _build_day_plan(day, df_master, df_custom,
+                           _mtime(DATA_PATH), _custom_days_version())
+
 # -------------------------------------------------
 # Mode / Tabs
 # -------------------------------------------------
 mode = st.radio("Select Training Mode:", ["Standard","Hemsworth High Volume"], horizontal=True)
 sets_col = "Standard Sets×Reps" if mode == "Standard" else "Hemsworth Sets×Reps"
 
-tab_names = ["Day 1","Day 2","Day 3","Day 4","Day 5","Day 6","Core","📊 Progress","🧱 Day Builder","🧩 Block Builder","⚙️ Reset"]
+DAY_TABS = ["Day 1","Day 2","Day 3","Day 4","Day 5","Day 6","Core"]
+tab_names = ["🏋️ Training","📊 Progress","🧱 Day Builder","🧩 Block Builder","⚙️ Reset"]
 tabs = st.tabs(tab_names)
 
 # -------------------------------------------------
 # Training Tabs
 # -------------------------------------------------
-for day, tab in zip(tab_names[:7], tabs[:7]):
-    with tab:
-        st.subheader(f"🏋️ {day}")
-        plan = get_day_plan(day, df, custom_days)
-
-        with st.expander("✏️ Edit Day Layout"):
-            if plan.empty:
-                st.info("No lifts found.")
-            else:
-                master_lifts = sorted(df["Lift / Exercise"].dropna().unique().tolist())
-                edited = []
-                for i, row in plan.iterrows():
-                    c1,c2,c3,c4 = st.columns([3,1,3,1])
-                    with c1:
-                        st.write(f"{row['Order']}. {row['Lift / Exercise']}")
-                    with c2:
-                        act = st.selectbox("Action", ["Keep","Replace","Remove"], key=f"act_{day}_{i}")
-                    with c3:
-                        repl = None
-                        if act == "Replace":
-                            repl = st.selectbox("Replace with", master_lifts, key=f"rep_{day}_{i}")
-                    with c4:
-                        new_order = st.number_input("Order", 1, 99, int(row["Order"]), key=f"ord_{day}_{i}")
-                    if act == "Remove":
-                        continue
-                    elif act == "Replace" and repl:
-                        meta = get_master_row(df, repl)
-                        edited.append({
-                            "DayTag": day, "Order": new_order, "Lift / Exercise": repl,
-                            **meta
-                        })
-                    else:
-                        r = row.to_dict()
-                        r["Order"] = int(new_order)
-                        edited.append(r)
-                if st.button(f"💾 Save {day} Layout"):
-                    updated = custom_days[custom_days["DayTag"] != day]
-                    new_day = pd.DataFrame(edited, columns=plan_columns())
-                    save_csv(pd.concat([updated, normalize_order(new_day)], ignore_index=True), CUSTOM_DAY_PATH)
-                    st.success("Saved layout.")
-                if st.button(f"↩️ Reset {day}"):
-                    save_csv(custom_days[custom_days["DayTag"] != day], CUSTOM_DAY_PATH)
-                    st.success("Reset to default.")
-
-        plan = get_day_plan(day, df, load_csv(CUSTOM_DAY_PATH, plan_columns()))
+with tabs[0]:
+    # Only the selected day's widgets are instantiated — the old per-tab loop
+    # built every day's widget tree on each rerun even though one was visible.
+    day = st.radio("Training Day", DAY_TABS, horizontal=True)
+    st.subheader(f"🏋️ {day}")
+    plan = get_day_plan(day, df, custom_days)
+
+    with st.expander("✏️ Edit Day Layout"):
         if plan.empty:
-            st.info("No lifts configured.")
-            continue
+            st.info("No lifts found.")
+        else:
+            # One batched grid instead of 4 widgets per row — delete rows to
+            # remove, pick a different lift to replace, edit Order to reorder
+            edited_plan = st.data_editor(
+                plan,
+                column_config={"Lift / Exercise": st.column_config.SelectboxColumn(
+                    "Lift / Exercise", options=list(MASTER_LIFTS), required=True)},
+                num_rows="dynamic",
+                key=f"editor_{day}",
+                use_container_width=True,
+            )
+            if st.button(f"💾 Save {day} Layout"):
+                updated = custom_days[custom_days["DayTag"] != day]
+                # Original lift per editor row — added rows get a fresh index
+                # and so count as changed
+                orig_lifts = plan["Lift / Exercise"].to_dict()
+                records = edited_plan.to_dict("records")
+                for idx, r in zip(edited_plan.index, records):
+                    r["DayTag"] = day
+                    # Replaced/added lifts take the library's metadata wholesale
+                    # (the editor row still shows the previous lift's values);
+                    # otherwise only genuinely blank cells are filled — NA-aware,
+                    # since the editor hands blanks back as missing, not ""
+                    lift_changed = orig_lifts.get(idx) != r["Lift / Exercise"]
+                    for k, v in get_master_row(df, r["Lift / Exercise"]).items():
+                        cur = r.get(k)
+                        if lift_changed or pd.isna(cur) or not str(cur).strip():
+                            r[k] = v
+                new_day = normalize_order(pd.DataFrame(records, columns=plan_columns()))
+                custom_days = pd.concat([updated, new_day], ignore_index=True)
+                save_custom_day(day, new_day)
+                st.success("Saved layout.")
+            if st.button(f"↩️ Reset {day}"):
+                custom_days = custom_days[custom_days["DayTag"] != day]
+                save_custom_day(day, pd.DataFrame(columns=plan_columns()))
+                st.success("Reset to default.")
 
+    # Reuse the frame updated above — no need to re-read the CSV mid-render
+    plan = get_day_plan(day, df, custom_days)
+    if plan.empty:
+        st.info("No lifts configured.")
+    else:
         st.dataframe(plan[[ "Order","Lift / Exercise","Purpose / Role","Region / Muscle Focus",sets_col,"Rest"]].rename(columns={sets_col:"Sets×Reps"}), use_container_width=True)
 
         st.markdown("### Log Sets")
         bulk = []
-        for i, row in plan.iterrows():
+        for i, row in enumerate(plan.to_dict("records")):
             c1,c2,c3,c4,c5 = st.columns([3,1,1,1,2])
             with c1: st.write(f"**{row['Lift / Exercise']}**")
             with c2: w = st.number_input("Weight",0,9999,0,5,key=f"w_{day}_{i}")
@@ -220,66 +375,89 @@ for day, tab in zip(tab_names[:7], tabs[:7]):
                 if st.button("Save",key=f"s_{day}_{i}"):
                     new = {"Date":datetime.now().strftime("%Y-%m-%d %H:%M"),"DayTag":day,
                            "Lift / Exercise":row["Lift / Exercise"],"Weight (lbs)":w,"Reps":r,"Notes":n,"Mode":mode}
-                    user_log.loc[len(user_log)] = new
-                    save_csv(user_log, LOG_PATH)
+                    # astype(str) keeps the concat Arrow-string-clean — int
+                    # Weight/Reps would flip the columns back to object
+                    new_rows = pd.DataFrame([new], columns=LOG_COLS).astype(str)
+                    save_csv_append(new_rows, LOG_PATH)
+                    user_log = pd.concat([user_log, new_rows], ignore_index=True)
                     st.success("Saved.")
             bulk.append((row["Lift / Exercise"],w,r,n))
         if st.button(f"💾 Save ALL {day}"):
             new = pd.DataFrame([{"Date":datetime.now().strftime("%Y-%m-%d %H:%M"),
                                  "DayTag":day,"Lift / Exercise":a,"Weight (lbs)":b,
-                                 "Reps":c,"Notes":d,"Mode":mode} for a,b,c,d in bulk])
+                                 "Reps":c,"Notes":d,"Mode":mode} for a,b,c,d in bulk],
+                               columns=LOG_COLS).astype(str)
+            save_csv_append(new, LOG_PATH)
             user_log = pd.concat([user_log,new],ignore_index=True)
-            save_csv(user_log,LOG_PATH)
             st.success("Saved all sets.")
         st.dataframe(user_log[user_log["DayTag"]==day].tail(10), use_container_width=True)
 
 # -------------------------------------------------
 # Progress Tab
 # -------------------------------------------------
-with tabs[7]:
+import plotly.express as px
+
+@st.cache_data(show_spinner=False)
+def build_trend_fig(trend_df: pd.DataFrame):
+    """Figure specs are ~10-100ms to build; reuse them while the data is unchanged."""
+    return px.line(trend_df,x="Date",y="Volume",markers=True,template="plotly_dark")
+
+@st.cache_data(show_spinner=False)
+def build_week_fig(week_df: pd.DataFrame):
+    return px.bar(week_df,x="Week",y="Volume",color="DayTag",barmode="group",template="plotly_dark")
+
+@st.cache_data(show_spinner=False)
+def build_report(_logs: pd.DataFrame, _prs: pd.DataFrame, _week: pd.DataFrame,
+                 log_mtime: float, dsel: str, lsel: str) -> bytes:
+    """Serialize the three report sheets; keyed on log version + filters."""
+    buf = BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as w:
+        _logs.to_excel(w, sheet_name="All Logs", index=False)
+        _prs.to_excel(w, sheet_name="PRs", index=False)
+        _week.to_excel(w, sheet_name="Weekly", index=False)
+    return buf.getvalue()
+
+with tabs[1]:
     st.header("📊 Progress Dashboard")
-    if user_log.empty:
+    typed_log=load_typed_logs(str(LOG_PATH), _mtime(LOG_PATH))
+    if typed_log.empty:
         st.info("No logs yet.")
         st.stop()
-    user_log["Date"]=pd.to_datetime(user_log["Date"],errors="coerce")
-    user_log["Volume"]=user_log["Weight (lbs)"]*user_log["Reps"]
-    user_log["Week"]=user_log["Date"].dt.isocalendar().week
-    dsel=st.selectbox("Day",["All"]+sorted(user_log["DayTag"].unique()))
-    lsel=st.selectbox("Lift",["All"]+sorted(user_log["Lift / Exercise"].unique()))
-    f=user_log.copy()
+    dsel=st.selectbox("Day",["All"]+sorted(typed_log["DayTag"].unique()))
+    lsel=st.selectbox("Lift",["All"]+sorted(typed_log["Lift / Exercise"].unique()))
+    # Filter first so the groupbys only touch the selected subset
+    f=typed_log
     if dsel!="All": f=f[f["DayTag"]==dsel]
     if lsel!="All": f=f[f["Lift / Exercise"]==lsel]
     trend=f.groupby("Date",as_index=False)["Volume"].sum().sort_values("Date")
-    st.plotly_chart(px.line(trend,x="Date",y="Volume",markers=True,template="plotly_dark"),use_container_width=True)
-    prs=f.groupby("Lift / Exercise",as_index=False).agg({"Weight (lbs)":"max","Reps":"max","Volume":"max"})
+    st.plotly_chart(build_trend_fig(trend),use_container_width=True)
+    prs=f.groupby("Lift / Exercise",as_index=False,observed=True).agg({"Weight (lbs)":"max","Reps":"max","Volume":"max"})
     st.dataframe(prs,use_container_width=True)
-    week=f.groupby(["Week","DayTag"],as_index=False)[["Weight (lbs)","Reps","Volume"]].sum()
-    st.plotly_chart(px.bar(week,x="Week",y="Volume",color="DayTag",barmode="group",template="plotly_dark"),use_container_width=True)
-    buf=BytesIO()
-    with pd.ExcelWriter(buf,engine="openpyxl") as w:
-        user_log.to_excel(w,"All Logs",index=False)
-        prs.to_excel(w,"PRs",index=False)
-        week.to_excel(w,"Weekly",index=False)
-    buf.seek(0)
-    st.download_button("📘 Download Excel Report",buf,file_name=f"Hemsworth_Report_{datetime.now().strftime('%Y-%m-%d')}.xlsx",mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+    week=f.groupby(["Week","DayTag"],as_index=False,observed=True)[["Weight (lbs)","Reps","Volume"]].sum()
+    st.plotly_chart(build_week_fig(week),use_container_width=True)
+    # Build the workbook only when asked for — not on every filter change
+    if st.button("📘 Build Excel Report"):
+        report = build_report(typed_log, prs, week, _mtime(LOG_PATH), dsel, lsel)
+        st.download_button("📘 Download Excel Report",report,file_name=f"Hemsworth_Report_{datetime.now().strftime('%Y-%m-%d')}.xlsx",mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
 # -------------------------------------------------
 # Block Builder Tab
 # -------------------------------------------------
-with tabs[9]:
+with tabs[3]:
     st.header("🧩 Custom Block Builder")
     if df.empty:
         st.info("Lift library empty.")
     else:
-        lift_choice = st.selectbox("Select Lift", sorted(df["Lift / Exercise"].unique().tolist()))
+        lift_choice = st.selectbox("Select Lift", MASTER_LIFTS)
         block_choice = st.selectbox("Block", ["A","B","C","D","E"])
         day_choice = st.selectbox("Assign to Day", ["Day 1","Day 2","Day 3","Day 4","Day 5","Day 6"])
         purpose = st.text_input("Purpose / Role")
 
         if st.button("➕ Add to Custom Block"):
             new_row = {"Lift / Exercise":lift_choice,"BlockGroup":block_choice,"DayTag":day_choice,"Purpose / Role":purpose}
-            custom_blocks.loc[len(custom_blocks)] = new_row
-            save_csv(custom_blocks, BLOCK_PATH)
+            new_df = pd.DataFrame([new_row])
+            save_csv_append(new_df, BLOCK_PATH)
+            custom_blocks = pd.concat([custom_blocks, new_df], ignore_index=True)
             st.success(f"Added {lift_choice} to Block {block_choice} ({day_choice})")
 
         if not custom_blocks.empty:
@@ -290,7 +468,7 @@ with tabs[9]:
 # -------------------------------------------------
 # Reset Tab
 # -------------------------------------------------
-with tabs[10]:
+with tabs[4]:
     st.header("⚙️ Reset Options")
     c1,c2,c3=st.columns(3)
     with c1:
@@ -303,5 +481,8 @@ with tabs[10]:
             st.success("Blocks cleared.")
     with c3:
         if st.button("🗑️ Clear Custom Days"):
-            save_csv(pd.DataFrame(columns=plan_columns()),CUSTOM_DAY_PATH)
+            if CUSTOM_DAY_DIR.exists():
+                for shard in CUSTOM_DAY_DIR.glob("*.csv"):
+                    shard.unlink()
+            CUSTOM_DAY_PATH.unlink(missing_ok=True)
             st.success("Custom days cleared.")
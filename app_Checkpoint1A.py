@@ -1,191 +1,421 @@
-import streamlit as st
-import pandas as pd
-from pathlib import Path
-from datetime import datetime
-import plotly.express as px
-from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-
-# -------------------------------------------------
-# Setup
-# -------------------------------------------------
-st.set_page_config(page_title="Hemsworth Training System", layout="wide")
-st.title("🦸 Hemsworth V6 Training System")
-st.caption("Full Control Edition — Auto Summaries, Block Builder, and Reset Options")
-
-DATA_PATH = Path("data") / "Hemsworth_Lift_Library.xlsx"
-LOG_PATH = Path("data") / "user_logs.csv"
-BLOCK_PATH = Path("data") / "custom_blocks.csv"
-
-# -------------------------------------------------
-# Load Lift Library
-# -------------------------------------------------
-def load_library(path):
-    if not path.exists():
-        st.error(f"File not found: {path}")
-        return None
-    df = pd.read_excel(path)
-    df.columns = [c.strip() for c in df.columns]
-    for c in df.columns:
-        if "rest" in c.lower():
-            df.rename(columns={c: "Rest"}, inplace=True)
-            break
-    return df
-
-df = load_library(DATA_PATH)
-if df is None:
-    st.stop()
-
-# -------------------------------------------------
-# Load User Logs
-# -------------------------------------------------
-if LOG_PATH.exists():
-    user_log = pd.read_csv(LOG_PATH)
-else:
-    user_log = pd.DataFrame(columns=["Date","DayTag","Lift / Exercise","Weight (lbs)","Reps","Notes","Mode"])
-
-# -------------------------------------------------
-# Load Custom Blocks
-# -------------------------------------------------
-if BLOCK_PATH.exists():
-    custom_blocks = pd.read_csv(BLOCK_PATH)
-else:
-    custom_blocks = pd.DataFrame(columns=["Lift / Exercise","BlockGroup","DayTag","Purpose / Role"])
-
-# -------------------------------------------------
-# Training Mode Toggle
-# -------------------------------------------------
-mode = st.radio("Select Training Mode:", ["Standard","Hemsworth High Volume"], horizontal=True)
-sets_col = "Standard Sets×Reps" if mode == "Standard" else "Hemsworth Sets×Reps"
-
-# -------------------------------------------------
-# Tabs
-# -------------------------------------------------
-days = ["Day 1","Day 2","Day 3","Day 4","Day 5","Day 6","Core","📊 Progress","🧩 Block Builder","⚙️ Reset"]
-tabs = st.tabs(days)
-
-# -------------------------------------------------
-# Training Tabs
-# -------------------------------------------------
-for day, tab in zip(days[:-3], tabs[:-3]):
-    with tab:
-        st.subheader(f"🏋️ {day}")
-        dday = df[df["DayTag"].astype(str).str.lower() == day.lower()]
-        if dday.empty:
-            st.info(f"No lifts tagged for {day}.")
-            continue
-        for idx, row in dday.iterrows():
-            c1,c2,c3,c4,c5,c6 = st.columns([3,1.3,1,1.5,2,1])
-            with c1:
-                st.markdown(f"**{row['Lift / Exercise']}**")
-                st.caption(f"{row['Purpose / Role']} | {row['Region / Muscle Focus']}")
-            with c2:
-                st.markdown(f"**{mode}**")
-                st.write(row[sets_col] if pd.notna(row[sets_col]) else "-")
-            with c3:
-                w = st.number_input("Weight", 0, None, 0, 5, key=f"w_{day}_{idx}")
-            with c4:
-                r = st.number_input("Reps", 0, None, 0, 1, key=f"r_{day}_{idx}")
-            with c5:
-                n = st.text_input("Notes (optional)", key=f"n_{day}_{idx}")
-            with c6:
-                if st.button("💾 Save", key=f"s_{day}_{idx}"):
-                    new = {"Date":datetime.now().strftime("%Y-%m-%d %H:%M"),
-                           "DayTag":day,"Lift / Exercise":row["Lift / Exercise"],
-                           "Weight (lbs)":w,"Reps":r,"Notes":n,"Mode":mode}
-                    user_log.loc[len(user_log)] = new
-                    user_log.to_csv(LOG_PATH, index=False)
-                    st.success(f"Saved {row['Lift / Exercise']}")
-        st.markdown("---")
-        st.dataframe(user_log[user_log["DayTag"]==day].tail(10), use_container_width=True)
-
-# -------------------------------------------------
-# 📊 Progress Dashboard + PRs + Weekly Summary
-# -------------------------------------------------
-with tabs[-3]:
-    st.header("📊 Progress Dashboard")
-    if user_log.empty:
-        st.info("No training data yet — log some sets first.")
-        st.stop()
-
-    user_log["Date"]=pd.to_datetime(user_log["Date"],errors="coerce")
-    user_log["Volume"]=user_log["Weight (lbs)"]*user_log["Reps"]
-    user_log["Week"]=user_log["Date"].dt.isocalendar().week
-
-    c1,c2=st.columns(2)
-    with c1:
-        d_filter=st.selectbox("Select Day",["All"]+sorted(user_log["DayTag"].dropna().unique().tolist()))
-    with c2:
-        l_filter=st.selectbox("Select Lift",["All"]+sorted(user_log["Lift / Exercise"].dropna().unique().tolist()))
-    f=user_log.copy()
-    if d_filter!="All": f=f[f["DayTag"]==d_filter]
-    if l_filter!="All": f=f[f["Lift / Exercise"]==l_filter]
-
-    st.markdown("### 📈 Volume Trend")
-    trend=f.groupby("Date",as_index=False)["Volume"].sum().sort_values("Date")
-    st.plotly_chart(px.line(trend,x="Date",y="Volume",markers=True,template="plotly_dark"),use_container_width=True)
-
-    st.markdown("### 🏆 Personal Records")
-    prs=(f.groupby("Lift / Exercise",as_index=False)
-         .agg({"Weight (lbs)":"max","Reps":"max","Volume":"max"}))
-    prs.columns=["Lift / Exercise","Max Weight","Max Reps","Max Volume"]
-    st.dataframe(prs,use_container_width=True)
-
-    # Weekly summary
-    st.markdown("### 📅 Weekly Summary")
-    week_summary=f.groupby(["Week","DayTag"],as_index=False)[["Weight (lbs)","Reps","Volume"]].sum()
-    st.dataframe(week_summary,use_container_width=True)
-    st.plotly_chart(px.bar(week_summary,x="Week",y="Volume",color="DayTag",barmode="group",template="plotly_dark"))
-
-    # Export section
-    excel_buffer=BytesIO()
-    with pd.ExcelWriter(excel_buffer,engine="openpyxl") as writer:
-        user_log.to_excel(writer,sheet_name="All Logs",index=False)
-        prs.to_excel(writer,sheet_name="PRs",index=False)
-        week_summary.to_excel(writer,sheet_name="Weekly Summary",index=False)
-    excel_buffer.seek(0)
-    st.download_button("📘 Download Excel Report",excel_buffer,file_name=f"Hemsworth_Report_{datetime.now().strftime('%Y-%m-%d')}.xlsx",mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-
-# -------------------------------------------------
-# 🧩 Block Builder
-# -------------------------------------------------
-with tabs[-2]:
-    st.header("🧩 Custom Block Builder")
-    lift_choice = st.selectbox("Select Lift", sorted(df["Lift / Exercise"].unique().tolist()))
-    block_choice = st.selectbox("Block", ["A","B","C","D","E"])
-    day_choice = st.selectbox("Assign to Day", ["Day 1","Day 2","Day 3","Day 4","Day 5","Day 6"])
-    purpose = st.text_input("Purpose / Role")
-
-    if st.button("➕ Add to Custom Block"):
-        new_row = {"Lift / Exercise":lift_choice,"BlockGroup":block_choice,"DayTag":day_choice,"Purpose / Role":purpose}
-        custom_blocks.loc[len(custom_blocks)] = new_row
-        custom_blocks.to_csv(BLOCK_PATH, index=False)
-        st.success(f"Added {lift_choice} to Block {block_choice} ({day_choice})")
-
-    st.markdown("### Current Custom Blocks")
-    if not custom_blocks.empty:
-        st.dataframe(custom_blocks,use_container_width=True)
-    else:
-        st.info("No custom blocks yet. Add some using the form above.")
-
-# -------------------------------------------------
-# ⚙️ Reset Options
-# -------------------------------------------------
-with tabs[-1]:
-    st.header("⚙️ Data Reset Options")
-    st.warning("⚠️ Be careful — deleted data cannot be recovered!")
-
-    col1,col2=st.columns(2)
-    with col1:
-        if st.button("🧹 Clear All Logs"):
-            user_log = pd.DataFrame(columns=["Date","DayTag","Lift / Exercise","Weight (lbs)","Reps","Notes","Mode"])
-            user_log.to_csv(LOG_PATH, index=False)
-            st.success("All user logs cleared.")
-    with col2:
-        if st.button("🗑️ Clear Custom Blocks"):
-            custom_blocks = pd.DataFrame(columns=["Lift / Exercise","BlockGroup","DayTag","Purpose / Role"])
-            custom_blocks.to_csv(BLOCK_PATH, index=False)
-            st.success("All custom blocks cleared.")
+import streamlit as st
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shutil
+from pathlib import Path
+from datetime import datetime
+import plotly.express as px
+from io import BytesIO
+from reportlab.lib.pagesizes import letter
+from reportlab.lib import colors
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet
+
+# -------------------------------------------------
+# Setup
+# -------------------------------------------------
+st.set_page_config(page_title="Hemsworth Training System", layout="wide")
+st.title("🦸 Hemsworth V6 Training System")
+st.caption("Full Control Edition — Auto Summaries, Block Builder, and Reset Options")
+
+DATA_PATH = Path("data") / "Hemsworth_Lift_Library.xlsx"
+LOG_DIR = Path("data") / "user_logs"              # append-only Parquet dataset
+LOG_PATH = Path("data") / "user_logs.csv"         # legacy layout, imported once
+BLOCK_DIR = Path("data") / "custom_blocks"        # append-only Parquet dataset
+BLOCK_PATH = Path("data") / "custom_blocks.csv"   # legacy layout, imported once
+
+# -------------------------------------------------
+# Load Lift Library
+# -------------------------------------------------
+def _mtime(path: Path) -> float:
+    return path.stat().st_mtime if path.exists() else 0.0
+
+# Only the columns the app actually touches — Parquet prunes the rest for free
+LIBRARY_COLS = [
+    "DayTag","Lift / Exercise","Purpose / Role","Region / Muscle Focus",
+    "Standard Sets×Reps","Hemsworth Sets×Reps","Rest"
+]
+
+@st.cache_data(show_spinner=False)
+def _load_library_cached(path_str: str, mtime: float) -> pd.DataFrame:
+    # Pure parse step so the cache key stays (path, mtime); UI errors
+    # are handled by the wrapper below. Prefer the Parquet conversion
+    # (see tools/convert_library.py) when it is at least as new as the
+    # workbook — columnar read beats openpyxl's XML parse by ~100×.
+    sidecar = Path(path_str).with_suffix(".parquet")
+    if sidecar.exists() and sidecar.stat().st_mtime >= mtime:
+        try:
+            return _categorize(pd.read_parquet(sidecar, columns=LIBRARY_COLS))
+        except (KeyError, ValueError):
+            pass  # stale/partial conversion — fall back to the workbook
+    df = pd.read_excel(path_str)
+    df.columns = [c.strip() for c in df.columns]
+    for c in df.columns:
+        if "rest" in c.lower():
+            df.rename(columns={c: "Rest"}, inplace=True)
+            break
+    return _categorize(df)
+
+# Low-cardinality label columns: category dtype stores each distinct name
+# once and lets groupby/filters run on integer codes
+_CATEGORY_COLS = ["DayTag","Lift / Exercise","Mode","Purpose / Role","Region / Muscle Focus"]
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    for c in _CATEGORY_COLS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    return df
+
+def load_library(path):
+    if not path.exists():
+        st.error(f"File not found: {path}")
+        return None
+    return _load_library_cached(str(path), _mtime(path))
+
+df = load_library(DATA_PATH)
+if df is None:
+    st.stop()
+
+# -------------------------------------------------
+# Load User Logs
+# -------------------------------------------------
+LOG_COLS = ["Date","DayTag","Lift / Exercise","Weight (lbs)","Reps","Notes","Mode"]
+
+def append_dataset(frame: pd.DataFrame, root: Path):
+    """Append one small Parquet fragment — existing files are never rewritten."""
+    pq.write_to_dataset(pa.Table.from_pandas(frame, preserve_index=False),
+                        root_path=str(root), compression="zstd")
+
+def _typed_log_frame(rows) -> pd.DataFrame:
+    """Uniform schema per fragment so the dataset reads back as one frame."""
+    f = pd.DataFrame(rows, columns=LOG_COLS)
+    f["Date"] = pd.to_datetime(f["Date"], errors="coerce")
+    for c in ("Weight (lbs)","Reps"):
+        f[c] = pd.to_numeric(f[c], errors="coerce").fillna(0).astype("int32")
+    for c in ("DayTag","Lift / Exercise","Notes","Mode"):
+        f[c] = f[c].astype(object).where(f[c].notna(), "").astype(str)
+    return f
+
+def _log_version() -> int:
+    return LOG_DIR.stat().st_mtime_ns if LOG_DIR.exists() else 0
+
+def _flush_pending():
+    """Write everything queued in session state as one Parquet fragment."""
+    pending = st.session_state.pop("pending_rows", [])
+    if pending:
+        append_dataset(pd.concat(pending, ignore_index=True), LOG_DIR)
+
+@st.cache_data(show_spinner=False)
+def _load_logs_cached(mtime_ns: int) -> pd.DataFrame:
+    """Typed log frame with Volume/Week derived once per log version.
+
+    Parquet preserves dtypes, so Date comes back as datetime64 — no
+    per-rerun to_datetime reparse."""
+    if not LOG_DIR.exists() or not any(LOG_DIR.iterdir()):
+        return pd.DataFrame(columns=LOG_COLS + ["Volume","Week"])
+    df = pd.read_parquet(LOG_DIR)
+    # Multiply the raw int32 arrays; int64 output so big sessions can't overflow
+    w = df["Weight (lbs)"].to_numpy(dtype=np.int32, copy=False)
+    r = df["Reps"].to_numpy(dtype=np.int32, copy=False)
+    df["Volume"] = np.multiply(w, r, dtype=np.int64)
+    df["Week"] = df["Date"].dt.isocalendar().week
+    return _categorize(df)
+
+# One-time import of the legacy CSV as the dataset's first fragment
+if not LOG_DIR.exists() and LOG_PATH.exists():
+    _legacy = pd.read_csv(LOG_PATH)
+    if not _legacy.empty:
+        append_dataset(_typed_log_frame(_legacy), LOG_DIR)
+
+user_log = _load_logs_cached(_log_version())
+
+# Saves queue in session state and flush to disk in one fragment. The
+# cached views below read only the on-disk dataset, so the queue is
+# merged here (for the empty checks), into Recent Logs in the day view,
+# and flushed outright when the Progress view opens.
+_pending = st.session_state.get("pending_rows", [])
+if _pending:
+    user_log = pd.concat([user_log, *_pending], ignore_index=True)
+
+@st.cache_data(show_spinner=False)
+def filter_options(mtime_ns: int):
+    """Selectbox option lists — category indexes are already unique and sorted,
+    so this skips the per-rerun hash + sort over the full log."""
+    f = _load_logs_cached(mtime_ns)
+    if f.empty:
+        return [], []
+    return (f["DayTag"].cat.categories.tolist(),
+            f["Lift / Exercise"].cat.categories.tolist())
+
+def _filtered_logs(mtime_ns: int, d_filter: str, l_filter: str) -> pd.DataFrame:
+    # Boolean masks over the cached typed frame — no defensive .copy()
+    f = _load_logs_cached(mtime_ns)
+    if d_filter != "All": f = f[f["DayTag"] == d_filter]
+    if l_filter != "All": f = f[f["Lift / Exercise"] == l_filter]
+    return f
+
+@st.cache_data(show_spinner=False)
+def compute_trend(mtime_ns: int, d_filter: str, l_filter: str) -> pd.DataFrame:
+    f = _filtered_logs(mtime_ns, d_filter, l_filter)
+    return f.groupby("Date", as_index=False, sort=False)["Volume"].sum().sort_values("Date")
+
+@st.cache_data(show_spinner=False)
+def compute_prs(mtime_ns: int, d_filter: str, l_filter: str) -> pd.DataFrame:
+    f = _filtered_logs(mtime_ns, d_filter, l_filter)
+    # One pass with named aggs — no separate rename step, no implicit key sort
+    return f.groupby("Lift / Exercise", as_index=False, sort=False, observed=True).agg(
+        **{"Max Weight": ("Weight (lbs)","max"),
+           "Max Reps": ("Reps","max"),
+           "Max Volume": ("Volume","max")})
+
+@st.cache_data(show_spinner=False)
+def compute_week_summary(mtime_ns: int, d_filter: str, l_filter: str) -> pd.DataFrame:
+    f = _filtered_logs(mtime_ns, d_filter, l_filter)
+    return f.groupby(["Week","DayTag"], as_index=False, sort=False, observed=True)[["Weight (lbs)","Reps","Volume"]].sum()
+
+@st.cache_data(show_spinner=False)
+def build_trend_fig(mtime_ns: int, d_filter: str, l_filter: str):
+    # Figure construction + JSON prep is the slow half of a plotly render;
+    # cache the built Figure on the same key as the frame it draws
+    return px.line(compute_trend(mtime_ns, d_filter, l_filter),
+                   x="Date", y="Volume", markers=True, template="plotly_dark")
+
+@st.cache_data(show_spinner=False)
+def build_week_fig(mtime_ns: int, d_filter: str, l_filter: str):
+    return px.bar(compute_week_summary(mtime_ns, d_filter, l_filter),
+                  x="Week", y="Volume", color="DayTag", barmode="group", template="plotly_dark")
+
+@st.cache_data(show_spinner=False)
+def build_excel(mtime_ns: int, d_filter: str, l_filter: str) -> bytes:
+    """Excel report as bytes, rebuilt only when the log or filters change."""
+    buf = BytesIO()
+    # xlsxwriter is write-only by design — a fraction of openpyxl's
+    # memory and noticeably faster serialization
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+        _load_logs_cached(mtime_ns).to_excel(writer, sheet_name="All Logs", index=False)
+        compute_prs(mtime_ns, d_filter, l_filter).to_excel(writer, sheet_name="PRs", index=False)
+        compute_week_summary(mtime_ns, d_filter, l_filter).to_excel(writer, sheet_name="Weekly Summary", index=False)
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False)
+def _day_groups(lib_mtime: float, _df: pd.DataFrame) -> dict:
+    """Lowercased DayTag -> library rows, built once per library version.
+
+    The tab loop then slices by key instead of re-lowercasing and
+    re-scanning the full frame for each of the seven tabs every rerun.
+    """
+    key = _df["DayTag"].astype(str).str.lower()
+    return dict(tuple(_df.groupby(key, sort=False)))
+
+@st.cache_data(show_spinner=False)
+def _log_day_groups(mtime_ns: int) -> dict:
+    df = _load_logs_cached(mtime_ns)
+    if df.empty:
+        return {}
+    return dict(tuple(df.groupby("DayTag", sort=False, observed=True)))
+
+# -------------------------------------------------
+# Load Custom Blocks
+# -------------------------------------------------
+# Full on-disk layout — the builder form only fills the first four fields,
+# the override columns ride along empty
+BLOCK_COLS = ["Lift / Exercise","BlockGroup","DayTag","Purpose / Role","Order",
+              "Override Standard Sets×Reps","Override Hemsworth Sets×Reps",
+              "Override Rest","Override Tempo / Notes"]
+
+def _typed_block_frame(rows) -> pd.DataFrame:
+    """All-string fragment so every file in the dataset shares one schema."""
+    f = pd.DataFrame(rows, columns=BLOCK_COLS).astype(object)
+    return f.where(f.notna(), "").astype(str)
+
+def _blocks_version() -> int:
+    return BLOCK_DIR.stat().st_mtime_ns if BLOCK_DIR.exists() else 0
+
+@st.cache_data(show_spinner=False)
+def _load_blocks_cached(mtime_ns: int) -> pd.DataFrame:
+    if not BLOCK_DIR.exists() or not any(BLOCK_DIR.iterdir()):
+        return pd.DataFrame(columns=BLOCK_COLS)
+    return pd.read_parquet(BLOCK_DIR)
+
+if not BLOCK_DIR.exists() and BLOCK_PATH.exists():
+    _legacy_blocks = pd.read_csv(BLOCK_PATH)
+    if not _legacy_blocks.empty:
+        append_dataset(_typed_block_frame(_legacy_blocks), BLOCK_DIR)
+
+custom_blocks = _load_blocks_cached(_blocks_version())
+
+# Block adds queue in session state like log saves do — merge the unflushed
+# ones so the Current Custom Blocks table stays complete
+_new_blocks = st.session_state.get("new_blocks", [])
+if _new_blocks:
+    custom_blocks = pd.concat([custom_blocks, _typed_block_frame(_new_blocks)],
+                              ignore_index=True)
+
+# -------------------------------------------------
+# Training Mode Toggle
+# -------------------------------------------------
+mode = st.radio("Select Training Mode:", ["Standard","Hemsworth High Volume"], horizontal=True)
+sets_col = "Standard Sets×Reps" if mode == "Standard" else "Hemsworth Sets×Reps"
+
+# -------------------------------------------------
+# View Selector
+# -------------------------------------------------
+# st.tabs executes every tab body on every rerun; a sidebar radio means
+# only the view the user is actually looking at does any work
+DAY_VIEWS = ["Day 1","Day 2","Day 3","Day 4","Day 5","Day 6","Core"]
+view = st.sidebar.radio("View", DAY_VIEWS + ["📊 Progress","🧩 Block Builder","⚙️ Reset"])
+
+# -------------------------------------------------
+# Training Days
+# -------------------------------------------------
+if view in DAY_VIEWS:
+    day = view
+    day_groups = _day_groups(_mtime(DATA_PATH), df)
+    st.subheader(f"🏋️ {day}")
+    dday = day_groups.get(day.lower())
+    if dday is None or dday.empty:
+        st.info(f"No lifts tagged for {day}.")
+    else:
+        # One editable grid per day instead of ~6 widgets per lift — a single
+        # widget tree to build on each rerun, and one batched write on save
+        grid = dday[["Lift / Exercise","Purpose / Role","Region / Muscle Focus",sets_col]].copy()
+        # One vectorized fill for unset prescriptions instead of per-row notna checks
+        grid[sets_col] = grid[sets_col].fillna("-")
+        grid["Weight (lbs)"] = 0
+        grid["Reps"] = 0
+        grid["Notes"] = ""
+        edited = st.data_editor(
+            grid,
+            num_rows="fixed",
+            key=f"editor_{day}",
+            disabled=["Lift / Exercise","Purpose / Role","Region / Muscle Focus",sets_col],
+            hide_index=True,
+            use_container_width=True,
+        )
+        if st.button(f"💾 Save {day}", key=f"save_{day}"):
+            entered = edited[(edited["Weight (lbs)"] > 0) | (edited["Reps"] > 0)]
+            if entered.empty:
+                st.info("Enter a weight or reps first.")
+            else:
+                stamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+                rows = [{"Date":stamp,"DayTag":day,
+                         "Lift / Exercise":r["Lift / Exercise"],
+                         "Weight (lbs)":r["Weight (lbs)"],"Reps":r["Reps"],
+                         "Notes":r["Notes"],"Mode":mode}
+                        for r in entered.to_dict("records")]
+                new_rows = _typed_log_frame(rows)
+                # Queue instead of writing — one disk write per session, not per save
+                st.session_state.setdefault("pending_rows", []).append(new_rows)
+                user_log = pd.concat([user_log, new_rows], ignore_index=True)
+                st.success(f"Queued {len(rows)} sets for {day}.")
+        pending = st.session_state.get("pending_rows", [])
+        if pending:
+            n_pending = sum(len(p) for p in pending)
+            if st.button(f"✅ Finish Day — write {n_pending} pending sets", key=f"flush_{day}"):
+                _flush_pending()
+                st.success(f"Wrote {n_pending} sets to disk.")
+        st.markdown("---")
+        recent = _log_day_groups(_log_version()).get(day)
+        # Queued-but-unflushed sets belong in Recent Logs too
+        queued = [p[p["DayTag"] == day] for p in st.session_state.get("pending_rows", [])]
+        queued = [q for q in queued if not q.empty]
+        if queued:
+            recent = pd.concat(([recent] if recent is not None else []) + queued,
+                               ignore_index=True)
+        if recent is not None:
+            st.dataframe(recent.tail(10), use_container_width=True)
+
+# -------------------------------------------------
+# 📊 Progress Dashboard + PRs + Weekly Summary
+# -------------------------------------------------
+elif view == "📊 Progress":
+    st.header("📊 Progress Dashboard")
+    if user_log.empty:
+        st.info("No training data yet — log some sets first.")
+        st.stop()
+
+    # Opening the dashboard ends the logging session — flush the queue so
+    # every aggregation below sees the just-entered sets
+    _flush_pending()
+    log_version=_log_version()
+    f_all=_load_logs_cached(log_version)
+
+    day_opts, lift_opts = filter_options(log_version)
+    c1,c2=st.columns(2)
+    with c1:
+        d_filter=st.selectbox("Select Day",["All"]+day_opts)
+    with c2:
+        l_filter=st.selectbox("Select Lift",["All"]+lift_opts)
+
+    st.markdown("### 📈 Volume Trend")
+    st.plotly_chart(build_trend_fig(log_version,d_filter,l_filter),use_container_width=True)
+
+    st.markdown("### 🏆 Personal Records")
+    prs=compute_prs(log_version,d_filter,l_filter)
+    st.dataframe(prs,use_container_width=True)
+
+    # Weekly summary
+    st.markdown("### 📅 Weekly Summary")
+    week_summary=compute_week_summary(log_version,d_filter,l_filter)
+    st.dataframe(week_summary,use_container_width=True)
+    st.plotly_chart(build_week_fig(log_version,d_filter,l_filter))
+
+    # Export section — bytes come from the cached builder, so reruns that
+    # don't change the log or filters skip the workbook serialization
+    st.download_button("📘 Download Excel Report",build_excel(log_version,d_filter,l_filter),file_name=f"Hemsworth_Report_{datetime.now().strftime('%Y-%m-%d')}.xlsx",mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+
+# -------------------------------------------------
+# 🧩 Block Builder
+# -------------------------------------------------
+elif view == "🧩 Block Builder":
+    st.header("🧩 Custom Block Builder")
+    lift_choice = st.selectbox("Select Lift", sorted(df["Lift / Exercise"].unique().tolist()))
+    block_choice = st.selectbox("Block", ["A","B","C","D","E"])
+    day_choice = st.selectbox("Assign to Day", ["Day 1","Day 2","Day 3","Day 4","Day 5","Day 6"])
+    purpose = st.text_input("Purpose / Role")
+
+    if st.button("➕ Add to Custom Block"):
+        new_row = {"Lift / Exercise":lift_choice,"BlockGroup":block_choice,"DayTag":day_choice,"Purpose / Role":purpose}
+        # Queue the dict — no per-add frame build or disk write
+        st.session_state.setdefault("new_blocks", []).append(new_row)
+        custom_blocks = pd.concat([custom_blocks, _typed_block_frame([new_row])], ignore_index=True)
+        st.success(f"Added {lift_choice} to Block {block_choice} ({day_choice})")
+
+    pending_blocks = st.session_state.get("new_blocks", [])
+    if pending_blocks:
+        if st.button(f"💾 Save Blocks — write {len(pending_blocks)} pending"):
+            append_dataset(_typed_block_frame(st.session_state.pop("new_blocks")), BLOCK_DIR)
+            st.success(f"Wrote {len(pending_blocks)} blocks to disk.")
+
+    st.markdown("### Current Custom Blocks")
+    if not custom_blocks.empty:
+        st.dataframe(custom_blocks,use_container_width=True)
+    else:
+        st.info("No custom blocks yet. Add some using the form above.")
+
+# -------------------------------------------------
+# ⚙️ Reset Options
+# -------------------------------------------------
+else:
+    st.header("⚙️ Data Reset Options")
+    st.warning("⚠️ Be careful — deleted data cannot be recovered!")
+
+    col1,col2=st.columns(2)
+    with col1:
+        if st.button("🧹 Clear All Logs"):
+            if LOG_DIR.exists():
+                shutil.rmtree(LOG_DIR)
+            # Leave an empty dataset dir so the legacy CSV isn't re-imported
+            LOG_DIR.mkdir(parents=True)
+            st.session_state.pop("pending_rows", None)
+            user_log = pd.DataFrame(columns=LOG_COLS)
+            st.success("All user logs cleared.")
+    with col2:
+        if st.button("🗑️ Clear Custom Blocks"):
+            if BLOCK_DIR.exists():
+                shutil.rmtree(BLOCK_DIR)
+            BLOCK_DIR.mkdir(parents=True)
+            custom_blocks = pd.DataFrame(columns=BLOCK_COLS)
+            st.success("All custom blocks cleared.")
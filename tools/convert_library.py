@@ -0,0 +1,33 @@
+"""One-time conversion of the lift library from xlsx to Parquet.
+
+Parquet is columnar, compressed and typed, so the apps can load it in
+single-digit milliseconds (with free column pruning) instead of paying
+openpyxl's XML parse on cold start. Re-run after editing the workbook:
+
+    python tools/convert_library.py [path/to/library.xlsx]
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+
+def convert(xlsx: Path) -> Path:
+    df = pd.read_excel(xlsx)
+    df.columns = [str(c).strip() for c in df.columns]
+    for c in list(df.columns):
+        if "rest" in c.lower() and c != "Rest":
+            df.rename(columns={c: "Rest"}, inplace=True)
+    # Mixed int/str cells (e.g. bare rest minutes) break Arrow conversion
+    for c in df.columns[df.dtypes == object]:
+        df[c] = df[c].map(lambda v: v if pd.isna(v) else str(v))
+    pq = xlsx.with_suffix(".parquet")
+    df.to_parquet(pq, engine="pyarrow", compression="zstd", index=False)
+    return pq
+
+
+if __name__ == "__main__":
+    src = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("data") / "Hemsworth_Lift_Library.xlsx"
+    if not src.exists():
+        sys.exit(f"File not found: {src}")
+    print(f"Wrote {convert(src)}")